@@ -1,13 +1,28 @@
 import sys
+import argparse
 import curses
 from curses import wrapper
 
-from src.data.parser import parse_input_file, calculate_round_sizes, get_round_names
+from src.data.parser import calculate_round_sizes, get_round_names
+from src.data.window import BracketWindow, DEFAULT_MAX_BYTES
 from src.ui.screens import show_welcome_screen, show_error_screen, show_no_file_screen
-from src.ui.bracket_view import format_bracket
+from src.ui.bracket_view import format_bracket, calculate_column_widths
 
 
-def main(stdscr):
+def bracket_layout(bracket):
+    """
+    Compute the round sizes, round names and column widths for a bracket.
+    """
+    round_sizes = calculate_round_sizes(bracket)
+    round_names = get_round_names(round_sizes)
+    return {
+        'round_sizes': round_sizes,
+        'round_names': round_names,
+        'column_widths': calculate_column_widths(bracket, round_sizes, round_names),
+    }
+
+
+def main(stdscr, filename=None, max_cache_bytes=DEFAULT_MAX_BYTES):
     """
     Main function using curses.
     """
@@ -17,9 +32,7 @@ def main(stdscr):
     stdscr.clear()
     
     # Check if a filename was provided
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
-    else:
+    if filename is None:
         # Display a message and exit if no filename
         show_no_file_screen(stdscr)
         return
@@ -27,56 +40,49 @@ def main(stdscr):
     # Show welcome screen
     show_welcome_screen(stdscr)
     
-    # Parse the input file
+    # Index the input file; brackets are decoded on demand into a bounded window
     try:
-        brackets = parse_input_file(filename)
-        
-        if not brackets:
-            show_error_screen(stdscr, "No valid brackets found in the input file.")
-            return
-        
-        # Format and display each bracket
-        current_bracket = 0
-        
-        while True:
-            # Ensure we have a valid bracket index
-            if current_bracket < 0:
-                current_bracket = len(brackets) - 1
-            elif current_bracket >= len(brackets):
-                current_bracket = 0
-        
-            # Skip empty brackets
-            if not brackets[current_bracket]:
-                current_bracket += 1
-                continue
+        with BracketWindow(filename, max_cache_bytes, layout=bracket_layout) as brackets:
+            if not len(brackets):
+                show_error_screen(stdscr, "No valid brackets found in the input file.")
+                return
             
-            # Calculate round sizes and names for the current bracket
-            round_sizes = calculate_round_sizes(brackets[current_bracket])
-            round_names = get_round_names(round_sizes)
+            # Format and display each bracket
+            current_bracket = 0
+            direction = 1
             
-            # Display the bracket
-            result = format_bracket(
-                stdscr,
-                brackets[current_bracket],
-                current_bracket + 1,
-                round_sizes,
-                round_names,
-                total_brackets=len(brackets)
-            )
-            
-            # Handle navigation result
-            if result == "quit":
-                break  # Exit the application
-            elif result == "next":
-                current_bracket += 1
-            elif result == "prev":
-                current_bracket -= 1
-            else:
-                # Default to next
-                current_bracket += 1
+            while True:
+                # Ensure we have a valid bracket index
+                current_bracket %= len(brackets)
+                
+                bracket, layout = brackets.get(current_bracket)
+                
+                # Load the neighbours we are heading towards while this one is displayed
+                brackets.prefetch(current_bracket, direction)
                 
-            # Clear the screen before showing the next bracket
-            stdscr.clear()
+                # Display the bracket
+                result = format_bracket(
+                    stdscr,
+                    bracket,
+                    current_bracket + 1,
+                    layout['round_sizes'],
+                    layout['round_names'],
+                    total_brackets=len(brackets),
+                    column_widths=layout['column_widths']
+                )
+                
+                # Handle navigation result
+                if result == "quit":
+                    break  # Exit the application
+                elif result == "prev":
+                    direction = -1
+                else:
+                    # "next", and default to next
+                    direction = 1
+                current_bracket += direction
+                    
+                # Clear the screen before showing the next bracket
+                stdscr.clear()
             
     except FileNotFoundError:
         show_error_screen(stdscr, f"File not found: {filename}")
@@ -86,5 +92,40 @@ def main(stdscr):
         traceback.print_exc()
         show_error_screen(stdscr, str(e))
 
+
+def serve(argv):
+    """
+    Run the JSON bracket server from command line arguments.
+    """
+    from src.server.app import run_server, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_CACHE_BYTES
+
+    parser = argparse.ArgumentParser(prog="main.py serve", description="Serve a bracket file as JSON.")
+    parser.add_argument("filename", help="Path to the bracket file")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument("--cache-mb", type=float, default=DEFAULT_CACHE_BYTES / (1024 * 1024),
+                        help="Size of the response cache in megabytes")
+    args = parser.parse_args(argv)
+
+    try:
+        run_server(args.filename, args.host, args.port, int(args.cache_mb * 1024 * 1024))
+    except FileNotFoundError:
+        sys.exit(f"File not found: {args.filename}")
+    except ValueError as e:
+        sys.exit(str(e))
+    except OSError as e:
+        sys.exit(f"Could not start server on {args.host}:{args.port}: {e}")
+
+
 if __name__ == "__main__":
-    wrapper(main)  # curses wrapper handles setup/teardown
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        serve(sys.argv[2:])
+    else:
+        parser = argparse.ArgumentParser(description="View NCAA brackets in the terminal.")
+        parser.add_argument("filename", nargs="?", help="Path to the bracket file")
+        parser.add_argument("--max-cache-mb", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                            help="Memory cap for decoded brackets held by the viewer, in megabytes")
+        args = parser.parse_args()
+        
+        # curses wrapper handles setup/teardown
+        wrapper(main, args.filename, int(args.max_cache_mb * 1024 * 1024))
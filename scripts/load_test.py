@@ -0,0 +1,135 @@
+"""
+NCAA Bracket Viewer - Server Load Test
+
+Drive the JSON bracket server with concurrent keep-alive clients and report
+throughput and latency. Given a bracket file, the server is started in-process
+on a free port; otherwise an already running server is targeted.
+
+Usage:
+    python scripts/load_test.py example/example-bracket
+    python scripts/load_test.py --port 8080 --clients 50 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.server.app import start_server, DEFAULT_HOST, DEFAULT_PORT
+
+
+async def fetch(reader, writer, path):
+    """
+    Send a GET request on an open connection and return (status, body).
+    """
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding") == "chunked":
+        body = bytearray()
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            chunk = await reader.readexactly(size + 2)
+            if size == 0:
+                break
+            body += chunk[:-2]
+        return status, bytes(body)
+
+    return status, await reader.readexactly(int(headers.get("content-length", 0)))
+
+
+async def run_client(host, port, num_requests, total_brackets, page_size, latencies, errors):
+    """
+    Issue a mix of single bracket, range and stats requests over one connection.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(num_requests):
+            roll = random.random()
+            if roll < 0.8:
+                path = f"/brackets/{random.randint(1, total_brackets)}"
+            elif roll < 0.95:
+                path = f"/brackets?start={random.randint(1, total_brackets)}&count={page_size}"
+            else:
+                path = "/stats"
+
+            started = time.perf_counter()
+            status, body = await fetch(reader, writer, path)
+            latencies.append(time.perf_counter() - started)
+
+            if status != 200:
+                errors.append(f"{path}: HTTP {status}")
+            else:
+                json.loads(body)
+    finally:
+        writer.close()
+
+
+async def load_test(args):
+    server = None
+    host, port = args.host, args.port
+    if args.filename:
+        server = await start_server(args.filename, host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        _, body = await fetch(reader, writer, "/stats")
+        writer.close()
+        total_brackets = json.loads(body)["total_brackets"]
+
+        latencies = []
+        errors = []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            run_client(host, port, args.requests, total_brackets, args.page_size, latencies, errors)
+            for _ in range(args.clients)
+        ))
+        elapsed = time.perf_counter() - started
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    latencies.sort()
+    print(f"Brackets:    {total_brackets}")
+    print(f"Requests:    {len(latencies)} from {args.clients} clients in {elapsed:.2f}s")
+    print(f"Throughput:  {len(latencies) / elapsed:.0f} req/s")
+    for pct in (50, 90, 99):
+        print(f"p{pct} latency: {latencies[min(len(latencies) - 1, len(latencies) * pct // 100)] * 1000:.2f} ms")
+    print(f"Errors:      {len(errors)}")
+    for error in errors[:10]:
+        print(f"  {error}")
+
+    return 1 if errors else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the bracket JSON server.")
+    parser.add_argument("filename", nargs="?", help="Bracket file to serve in-process (omit to target a running server)")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Server address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Server port (default: {DEFAULT_PORT})")
+    parser.add_argument("--clients", type=int, default=20, help="Number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per client")
+    parser.add_argument("--page-size", type=int, default=50, help="Brackets per range request")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(load_test(args)))
+
+
+if __name__ == "__main__":
+    main()
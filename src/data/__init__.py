@@ -1,3 +1,4 @@
 from .parser import parse_input_file, calculate_round_sizes, get_round_names
+from .cache import LRUCache
 
-__all__ = ['parse_input_file', 'calculate_round_sizes', 'get_round_names']
\ No newline at end of file
+__all__ = ['parse_input_file', 'calculate_round_sizes', 'get_round_names', 'LRUCache']
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+NCAA Bracket Viewer - LRU Cache
+
+This module provides a small size-bounded least-recently-used cache.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Least-recently-used cache bounded by the total size of its values.
+
+    Args:
+        max_size: Maximum total size of all cached values
+        sizeof: Function returning the size of a value (defaults to 1 per entry)
+    """
+
+    def __init__(self, max_size, sizeof=None):
+        self.max_size = max_size
+        self.sizeof = sizeof or (lambda value: 1)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Return the value for key and mark it as most recently used.
+        """
+        if key not in self._entries:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entries to stay under max_size.
+
+        Values larger than max_size on their own are not cached.
+        """
+        size = self.sizeof(value)
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+
+        if size > self.max_size:
+            return
+
+        self._entries[key] = (value, size)
+        self.size += size
+
+        while self.size > self.max_size:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+
+    def clear(self):
+        """
+        Remove every entry from the cache.
+        """
+        self._entries.clear()
+        self.size = 0
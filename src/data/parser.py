@@ -1,3 +1,10 @@
+from array import array
+
+
+# Longest bracket index_brackets will buffer while looking for its closing ']'
+MAX_BRACKET_SIZE = 4 * 1024 * 1024
+
+
 def parse_input_file(filename):
     """
     Parse the input file containing bracket data.
@@ -20,15 +27,8 @@ def parse_input_file(filename):
         if bracket_end == -1:
             break
         
-        # Extract the bracket content
-        bracket_content = content[bracket_start+1:bracket_end]
-        
-        # Parse the teams
-        teams = []
-        for team in bracket_content.split(','):
-            team = team.strip("' \"\t\n")
-            if team:
-                teams.append(team)
+        # Extract the bracket content and parse the teams
+        teams = parse_teams(content[bracket_start+1:bracket_end])
         
         if teams:
             brackets.append(teams)
@@ -40,6 +40,87 @@ def parse_input_file(filename):
     return brackets
 
 
+def parse_teams(bracket_content):
+    """
+    Parse the comma separated team names between a bracket's square brackets.
+    """
+    teams = []
+    for team in bracket_content.split(','):
+        team = team.strip("' \"\t\r\n")
+        if team:
+            teams.append(team)
+    
+    return teams
+
+
+def index_brackets(filename, chunk_size=1024 * 1024, max_bracket_size=MAX_BRACKET_SIZE):
+    """
+    Scan the input file and record where each non-empty bracket is stored.
+    
+    The file is read in chunks so only one chunk and one partial bracket are held in
+    memory at a time.
+    
+    Returns:
+        Tuple of (starts, ends) arrays with the byte offsets of each bracket's content
+    
+    Raises:
+        ValueError: If a bracket is still open after max_bracket_size bytes
+    """
+    starts = array('q')
+    ends = array('q')
+    
+    with open(filename, 'rb') as f:
+        buffer = bytearray()
+        buffer_offset = 0  # File offset of buffer[0]
+        resume = 0  # Where to continue looking for the carried bracket's ']'
+        
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buffer += chunk
+            
+            position = 0
+            while True:
+                bracket_start = buffer.find(b'[', position)
+                if bracket_start == -1:
+                    buffer_offset += len(buffer)
+                    buffer.clear()
+                    break
+                
+                bracket_end = buffer.find(b']', max(bracket_start, resume))
+                if bracket_end == -1:
+                    if len(buffer) - bracket_start > max_bracket_size:
+                        raise ValueError(
+                            f"Bracket starting at byte {buffer_offset + bracket_start} "
+                            f"has no closing ']' within {max_bracket_size} bytes"
+                        )
+                    # Keep the partial bracket for the next chunk, which only needs
+                    # to be searched from where this one ended
+                    buffer_offset += bracket_start
+                    del buffer[:bracket_start]
+                    resume = len(buffer)
+                    break
+                resume = 0
+                
+                # Cheap emptiness check matching parse_teams, without building the team list
+                if buffer[bracket_start+1:bracket_end].strip(b"' \"\t\r\n,"):
+                    starts.append(buffer_offset + bracket_start + 1)
+                    ends.append(buffer_offset + bracket_end)
+                
+                position = bracket_end + 1
+    
+    return starts, ends
+
+
+def read_bracket(f, start, end):
+    """
+    Read and parse one bracket from a binary file using offsets from index_brackets.
+    """
+    f.seek(start)
+    return parse_teams(f.read(end - start).decode())
+
+
 def calculate_round_sizes(bracket):
     """
     Calculate the number of teams in each round of a bracket.
@@ -0,0 +1,120 @@
+"""
+NCAA Bracket Viewer - Bracket Window
+
+This module keeps a memory-bounded window of decoded brackets, reading them from
+the input file on demand instead of loading the whole file.
+"""
+
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .parser import index_brackets, read_bracket
+from .cache import LRUCache
+
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_PREFETCH = 2
+
+# Prefetch failures are logged here for callers that opt in by configuring a handler;
+# without one they would be written to stderr over the curses screen. The failure
+# is raised again on the main thread when the bracket is requested with get().
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def estimate_size(value):
+    """
+    Roughly estimate the memory used by a value built from lists, tuples, dicts and strings.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class BracketWindow:
+    """
+    Random access to the brackets in a file, holding only recently used ones in memory.
+
+    Each entry is a (teams, layout) tuple, where layout is whatever the layout
+    function computes for the bracket. Entries are kept in an LRU bounded by
+    max_bytes, and neighbours of the current bracket can be loaded ahead of time
+    on a background thread.
+
+    Args:
+        filename: Path to the bracket file
+        max_bytes: Approximate cap on the memory used by cached entries
+        layout: Function computing the layout for a list of teams
+        prefetch: Number of brackets to load ahead in the direction of travel
+    """
+
+    def __init__(self, filename, max_bytes=DEFAULT_MAX_BYTES, layout=None, prefetch=DEFAULT_PREFETCH):
+        self.starts, self.ends = index_brackets(filename)
+        self.layout = layout or (lambda teams: None)
+        self.prefetch_count = prefetch
+        self.cache = LRUCache(max_bytes, sizeof=estimate_size)
+        self._file = open(filename, 'rb')
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = []
+
+    def __len__(self):
+        return len(self.starts)
+
+    def get(self, index):
+        """
+        Return the (teams, layout) entry for a zero-based bracket index.
+        """
+        with self._lock:
+            entry = self.cache.get(index)
+            if entry is None:
+                teams = read_bracket(self._file, self.starts[index], self.ends[index])
+                entry = (teams, self.layout(teams))
+                self.cache.put(index, entry)
+            return entry
+
+    def prefetch(self, index, direction=1):
+        """
+        Load the brackets following index in the given direction (1 or -1) in the background.
+
+        Indexes wrap around, matching the viewer's navigation. Prefetches from the
+        previous call that have not started yet are cancelled.
+        """
+        for future in self._pending:
+            future.cancel()
+
+        self._pending = []
+        for step in range(1, self.prefetch_count + 1):
+            neighbour = (index + direction * step) % len(self)
+            if neighbour not in self.cache:
+                future = self._executor.submit(self._load, neighbour)
+                future.add_done_callback(self._report_failure)
+                self._pending.append(future)
+
+    def _load(self, index):
+        if index not in self.cache:
+            self.get(index)
+
+    @staticmethod
+    def _report_failure(future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Failed to prefetch bracket", exc_info=future.exception())
+
+    def close(self):
+        """
+        Stop prefetching and close the bracket file.
+        """
+        for future in self._pending:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
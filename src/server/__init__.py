@@ -0,0 +1,3 @@
+from .app import BracketServer, start_server, run_server
+
+__all__ = ['BracketServer', 'start_server', 'run_server']
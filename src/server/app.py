@@ -0,0 +1,281 @@
+"""
+NCAA Bracket Viewer - JSON Server
+
+This module serves parsed bracket data as JSON over a small asyncio HTTP server,
+so several people can browse one bracket file without each loading it.
+"""
+
+import asyncio
+import json
+from collections import Counter
+from urllib.parse import urlsplit, parse_qs
+
+from ..data.parser import parse_input_file, calculate_round_sizes, get_round_names
+from ..data.cache import LRUCache
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_CACHE_BYTES = 16 * 1024 * 1024
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    431: "Request Header Fields Too Large",
+    505: "HTTP Version Not Supported",
+}
+
+
+class BracketServer:
+    """
+    Serve brackets loaded once from a file.
+
+    Routes:
+        GET /brackets/{n}                  - A single bracket (numbered from 1)
+        GET /brackets?start=N&count=M      - A page of up to MAX_PAGE_SIZE brackets, streamed
+        GET /stats                         - Summary statistics for the whole file
+
+    Args:
+        brackets: List of brackets, each a list of team names
+        cache_bytes: Maximum size of the serialized response cache in bytes
+    """
+
+    def __init__(self, brackets, cache_bytes=DEFAULT_CACHE_BYTES):
+        self.brackets = brackets
+        self.cache = LRUCache(cache_bytes, sizeof=len)
+        # The brackets never change after loading, so the summary is built once
+        # and kept out of the LRU where bracket traffic could evict it
+        self.stats_body = self.build_stats_json()
+
+    def bracket_json(self, index, cache=True):
+        """
+        Return the serialized JSON for the bracket at a zero-based index.
+
+        With cache=False a cached body is still used, but a new one is not stored.
+        """
+        body = self.cache.get(("bracket", index))
+        if body is None:
+            bracket = self.brackets[index]
+            round_sizes = calculate_round_sizes(bracket)
+            body = json.dumps({
+                "bracket": index + 1,
+                "teams": bracket,
+                "champion": bracket[-1],
+                "round_sizes": round_sizes,
+                "round_names": get_round_names(round_sizes),
+            }).encode()
+            if cache:
+                self.cache.put(("bracket", index), body)
+        return body
+
+    def build_stats_json(self):
+        """
+        Build the serialized JSON summary of all brackets.
+        """
+        champions = Counter(bracket[-1] for bracket in self.brackets)
+        sizes = Counter(len(bracket) for bracket in self.brackets)
+        return json.dumps({
+            "total_brackets": len(self.brackets),
+            "bracket_sizes": {str(size): count for size, count in sorted(sizes.items())},
+            "champions": dict(champions.most_common()),
+        }).encode()
+
+    async def handle_client(self, reader, writer):
+        """
+        Handle requests on one connection until the client closes it.
+        """
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+
+                    headers = {}
+                    while True:
+                        header = await reader.readline()
+                        if header in (b"\r\n", b"\n", b""):
+                            break
+                        name, _, value = header.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip().lower()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # readline raises ValueError when a line exceeds the stream limit
+                    await self.send_error(writer, 431, "Request line or header too long", keep_alive=False)
+                    break
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    await self.send_error(writer, 400, "Malformed request line", keep_alive=False)
+                    break
+
+                method, target, version = parts
+                if version == "HTTP/1.1":
+                    keep_alive = headers.get("connection") != "close"
+                elif version == "HTTP/1.0":
+                    keep_alive = headers.get("connection") == "keep-alive"
+                else:
+                    await self.send_error(writer, 505, f"Unsupported version: {version}", keep_alive=False)
+                    break
+
+                if method != "GET":
+                    await self.send_error(writer, 405, f"Method not allowed: {method}", keep_alive)
+                else:
+                    keep_alive = await self.route(writer, target, keep_alive, chunked=version == "HTTP/1.1")
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, writer, target, keep_alive=True, chunked=True):
+        """
+        Dispatch a GET request to the matching handler.
+
+        Returns:
+            Whether the connection can be kept open for another request
+        """
+        url = urlsplit(target)
+        path = url.path.rstrip("/")
+
+        if path == "/stats":
+            await self.send_body(writer, self.stats_body, keep_alive=keep_alive)
+
+        elif path == "/brackets":
+            query = parse_qs(url.query)
+            try:
+                start = int(query.get("start", ["1"])[0])
+                count = int(query.get("count", [str(DEFAULT_PAGE_SIZE)])[0])
+            except ValueError:
+                await self.send_error(writer, 400, "start and count must be integers", keep_alive)
+                return keep_alive
+            if start < 1 or count < 1:
+                await self.send_error(writer, 400, "start and count must be >= 1", keep_alive)
+                return keep_alive
+            return await self.send_range(writer, start, min(count, MAX_PAGE_SIZE), keep_alive, chunked)
+
+        elif path.startswith("/brackets/"):
+            try:
+                bracket_num = int(path[len("/brackets/"):])
+            except ValueError:
+                await self.send_error(writer, 400, "Bracket number must be an integer", keep_alive)
+                return keep_alive
+            if not 1 <= bracket_num <= len(self.brackets):
+                await self.send_error(writer, 404, f"No bracket {bracket_num}", keep_alive)
+                return keep_alive
+            await self.send_body(writer, self.bracket_json(bracket_num - 1), keep_alive=keep_alive)
+
+        else:
+            await self.send_error(writer, 404, f"Unknown path: {url.path}", keep_alive)
+
+        return keep_alive
+
+    async def send_range(self, writer, start, count, keep_alive=True, chunked=True):
+        """
+        Stream a page of brackets as a JSON response.
+
+        Each bracket is written separately so a large page is never held in memory.
+        HTTP/1.1 clients get a chunked response; without chunked encoding (HTTP/1.0)
+        the end of the body is marked by closing the connection.
+
+        Returns:
+            Whether the connection can be kept open for another request
+        """
+        total = len(self.brackets)
+        first = start - 1
+        last = min(first + count, total)
+
+        head = {"start": start, "count": max(0, last - first), "total": total}
+        if last < total:
+            head["next"] = f"/brackets?start={last + 1}&count={count}"
+
+        if chunked:
+            write = lambda data: self.write_chunk(writer, data)
+            framing = b"Transfer-Encoding: chunked\r\n"
+        else:
+            write = writer.write
+            framing = b""
+            keep_alive = False
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/json\r\n"
+            + framing
+            + self.connection_header(keep_alive)
+            + b"\r\n"
+        )
+        write(json.dumps(head)[:-1].encode() + b', "brackets": [')
+
+        for index in range(first, last):
+            # Don't let one large page evict the single bracket responses
+            body = self.bracket_json(index, cache=False)
+            write(body if index == first else b"," + body)
+            await writer.drain()
+
+        write(b"]}")
+        if chunked:
+            writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        return keep_alive
+
+    @staticmethod
+    def write_chunk(writer, data):
+        writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    @staticmethod
+    def connection_header(keep_alive):
+        return b"Connection: keep-alive\r\n" if keep_alive else b"Connection: close\r\n"
+
+    async def send_body(self, writer, body, status=200, keep_alive=True):
+        """
+        Send a complete JSON response.
+        """
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n".encode()
+            + self.connection_header(keep_alive)
+            + b"\r\n"
+            + body
+        )
+        await writer.drain()
+
+    async def send_error(self, writer, status, message, keep_alive=True):
+        await self.send_body(writer, json.dumps({"error": message}).encode(), status, keep_alive)
+
+
+async def start_server(filename, host=DEFAULT_HOST, port=DEFAULT_PORT, cache_bytes=DEFAULT_CACHE_BYTES):
+    """
+    Load a bracket file and start serving it.
+
+    Returns:
+        The asyncio server object (port 0 picks a free port)
+    """
+    brackets = parse_input_file(filename)
+    if not brackets:
+        raise ValueError("No valid brackets found in the input file.")
+
+    app = BracketServer(brackets, cache_bytes)
+    return await asyncio.start_server(app.handle_client, host, port)
+
+
+def run_server(filename, host=DEFAULT_HOST, port=DEFAULT_PORT, cache_bytes=DEFAULT_CACHE_BYTES):
+    """
+    Serve a bracket file until interrupted.
+    """
+    async def serve():
+        server = await start_server(filename, host, port, cache_bytes)
+        for sock in server.sockets:
+            print(f"Serving {filename} on http://{sock.getsockname()[0]}:{sock.getsockname()[1]}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
@@ -1,6 +1,6 @@
 from .components import draw_box, setup_colors, display_team, display_instructions, display_title
 from .screens import show_welcome_screen, show_error_screen, show_no_file_screen
-from .bracket_view import format_bracket
+from .bracket_view import format_bracket, calculate_column_widths
 
 __all__ = [
     'draw_box',
@@ -11,5 +11,6 @@ __all__ = [
     'show_welcome_screen',
     'show_error_screen',
     'show_no_file_screen',
-    'format_bracket'
+    'format_bracket',
+    'calculate_column_widths'
 ]
\ No newline at end of file
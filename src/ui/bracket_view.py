@@ -8,7 +8,36 @@ import curses
 from .components import draw_box, display_team, display_title, display_instructions, setup_colors
 
 
-def format_bracket(stdscr, bracket_list, bracket_num, round_sizes, round_names, total_brackets):
+def calculate_column_widths(bracket_list, round_sizes, round_names):
+    """
+    Calculate the display width of each round's column.
+    
+    Args:
+        bracket_list: List of teams in the bracket
+        round_sizes: List of integers representing the number of teams in each round
+        round_names: List of strings with round names
+    """
+    longest_team_names = []
+    start_idx = 0
+    
+    for i, size in enumerate(round_sizes):
+        longest_name = 0
+        for j in range(size):
+            if start_idx + j < len(bracket_list):
+                team = bracket_list[start_idx + j]
+                try:
+                    longest_name = max(longest_name, len(team.replace('-', ' ').title()))
+                except Exception:
+                    # If there's an error with a team name, use a default length
+                    longest_name = max(longest_name, 20)
+        longest_team_names.append(longest_name)
+        start_idx += size
+    
+    # Each column needs space for: number (3), team name, and some padding (3)
+    return [max(len(round_names[i]), longest_team_names[i] + 6) for i in range(len(round_sizes))]
+
+
+def format_bracket(stdscr, bracket_list, bracket_num, round_sizes, round_names, total_brackets, column_widths=None):
     """
     Format and display a bracket with curses for fancy terminal display.
     
@@ -18,6 +47,8 @@ def format_bracket(stdscr, bracket_list, bracket_num, round_sizes, round_names,
         bracket_num: Number of the current bracket (for display purposes)
         round_sizes: List of integers representing the number of teams in each round
         round_names: List of strings with round names
+        total_brackets: Total number of brackets (for display purposes)
+        column_widths: Precomputed widths from calculate_column_widths (optional)
     """    
     # Get terminal dimensions
     max_y, max_x = stdscr.getmaxyx()
@@ -41,24 +72,8 @@ def format_bracket(stdscr, bracket_list, bracket_num, round_sizes, round_names,
             stdscr.getch()  # Wait for keypress to acknowledge
     
     # Calculate column widths and how many rounds we can fit side by side
-    longest_team_names = []
-    start_idx = 0
-    
-    for i, size in enumerate(round_sizes):
-        longest_name = 0
-        for j in range(size):
-            if start_idx + j < len(bracket_list):
-                team = bracket_list[start_idx + j]
-                try:
-                    longest_name = max(longest_name, len(team.replace('-', ' ').title()))
-                except Exception:
-                    # If there's an error with a team name, use a default length
-                    longest_name = max(longest_name, 20)
-        longest_team_names.append(longest_name)
-        start_idx += size
-    
-    # Each column needs space for: number (3), team name, and some padding (3)
-    column_widths = [max(len(round_names[i]), longest_team_names[i] + 6) for i in range(len(round_sizes))]
+    if column_widths is None:
+        column_widths = calculate_column_widths(bracket_list, round_sizes, round_names)
     
     # Calculate how many rounds we can display at once based on screen width
     # We need to account for column widths plus spacing
@@ -0,0 +1,61 @@
+from src.data.cache import LRUCache
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_bounded_by_value_size():
+    cache = LRUCache(10, sizeof=len)
+    cache.put("a", b"xxxx")
+    cache.put("b", b"xxxx")
+    cache.put("c", b"xxxx")
+
+    assert "a" not in cache
+    assert cache.size == 8
+
+
+def test_replacing_a_key_updates_size():
+    cache = LRUCache(10, sizeof=len)
+    cache.put("a", b"xxxx")
+    cache.put("a", b"xx")
+
+    assert cache.size == 2
+    assert cache.get("a") == b"xx"
+
+
+def test_oversized_values_are_not_cached():
+    cache = LRUCache(4, sizeof=len)
+    cache.put("a", b"xx")
+    cache.put("b", b"xxxxx")
+
+    assert "b" not in cache
+    assert cache.get("a") == b"xx"
+    assert cache.size == 2
+
+
+def test_counts_hits_and_misses():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b", "default")
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_clear():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.size == 0
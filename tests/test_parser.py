@@ -0,0 +1,78 @@
+import pytest
+
+from src.data.parser import (
+    parse_input_file,
+    parse_teams,
+    index_brackets,
+    read_bracket,
+    calculate_round_sizes,
+    get_round_names,
+)
+
+
+CONTENTS = {
+    "single line": "['duke', 'unc', 'duke'] ['kansas', 'baylor', 'baylor']",
+    "crlf": "['duke',\r\n 'unc',\r\n 'duke']\r\n['kansas',\r\n 'baylor',\r\n 'baylor']\r\n",
+    "double quotes": '["duke", "unc", "duke"]\n\t["ucla", "gonzaga", "gonzaga"]\n',
+    "empty brackets": "[] ['duke', 'unc', 'duke'] [ ' ', ] ['kansas', 'baylor', 'baylor'] [\r\n]",
+    "unterminated": "['duke', 'unc', 'duke'] ['kansas', 'bay",
+    "non-ascii": "['san-josé', 'unc', 'san-josé']",
+}
+
+
+def read_indexed(filename, chunk_size):
+    starts, ends = index_brackets(filename, chunk_size=chunk_size)
+    with open(filename, 'rb') as f:
+        return [read_bracket(f, start, end) for start, end in zip(starts, ends)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1024 * 1024])
+@pytest.mark.parametrize("name", sorted(CONTENTS))
+def test_index_matches_parse_input_file(tmp_path, name, chunk_size):
+    path = tmp_path / "brackets"
+    path.write_bytes(CONTENTS[name].encode())
+
+    assert read_indexed(str(path), chunk_size) == parse_input_file(str(path))
+
+
+def test_crlf_bracket_spanning_lines(tmp_path):
+    path = tmp_path / "brackets"
+    path.write_bytes(b"['duke',\r\n 'unc',\r\n 'duke']")
+
+    assert parse_input_file(str(path)) == [['duke', 'unc', 'duke']]
+    assert read_indexed(str(path), 4) == [['duke', 'unc', 'duke']]
+
+
+def test_unterminated_bracket_followed_by_data(tmp_path):
+    path = tmp_path / "brackets"
+    path.write_bytes(b"['duke', 'unc', 'duke'] ['kansas', " + b"x" * 100000)
+
+    assert read_indexed(str(path), 64) == parse_input_file(str(path)) == [['duke', 'unc', 'duke']]
+
+
+def test_unterminated_bracket_over_size_limit(tmp_path):
+    path = tmp_path / "brackets"
+    path.write_bytes(b"['duke', 'unc', 'duke'] ['kansas', " + b"x" * 100000)
+
+    with pytest.raises(ValueError, match="no closing"):
+        index_brackets(str(path), chunk_size=64, max_bracket_size=1000)
+
+
+def test_bracket_within_size_limit_across_chunks(tmp_path):
+    path = tmp_path / "brackets"
+    path.write_bytes(b"['" + b"x" * 900 + b"', 'unc', 'duke']")
+
+    starts, ends = index_brackets(str(path), chunk_size=64, max_bracket_size=1000)
+    assert (list(starts), list(ends)) == ([1], [path.stat().st_size - 1])
+
+
+def test_parse_teams_strips_quotes_and_whitespace():
+    assert parse_teams(" 'duke',\r\n \"unc\" ,\t'' ") == ['duke', 'unc']
+
+
+def test_round_sizes_and_names():
+    round_sizes = calculate_round_sizes(['team'] * 63)
+
+    assert round_sizes == [32, 16, 8, 4, 2, 1]
+    assert get_round_names(round_sizes)[-1] == "Championship"
+    assert get_round_names([2, 1]) == ["Round 1", "Round 2"]
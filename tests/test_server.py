@@ -0,0 +1,207 @@
+import asyncio
+import json
+
+import pytest
+
+from src.server.app import BracketServer, MAX_PAGE_SIZE
+
+
+BRACKETS = [
+    ["duke", "unc", "duke"],
+    ["kansas", "baylor", "baylor"],
+    ["gonzaga", "ucla", "gonzaga"],
+]
+
+
+def request(raw, brackets=BRACKETS, cache_bytes=1024 * 1024, app=None):
+    """
+    Send raw request bytes to a server and return everything it writes before closing.
+
+    A fresh BracketServer is used unless app is given.
+    """
+    async def run(app):
+        if app is None:
+            app = BracketServer(brackets, cache_bytes)
+        server = await asyncio.start_server(app.handle_client, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(raw)
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+            return app, response
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(run(app))
+
+
+def get(path, version="HTTP/1.1", **kwargs):
+    """
+    GET a path on a closing connection and return (app, status, headers, body).
+    """
+    app, response = request(f"GET {path} {version}\r\nConnection: close\r\n\r\n".encode(), **kwargs)
+    head, _, body = response.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding") == "chunked":
+        body = dechunk(body)
+    return app, int(lines[0].split()[1]), headers, body
+
+
+def dechunk(data):
+    body = b""
+    while True:
+        size_line, _, data = data.partition(b"\r\n")
+        size = int(size_line, 16)
+        if size == 0:
+            return body
+        body += data[:size]
+        data = data[size + 2:]
+
+
+def test_single_bracket():
+    _, status, headers, body = get("/brackets/2")
+
+    assert status == 200
+    assert int(headers["content-length"]) == len(body)
+    data = json.loads(body)
+    assert data["bracket"] == 2
+    assert data["teams"] == BRACKETS[1]
+    assert data["champion"] == "baylor"
+    assert data["round_sizes"] == [2, 1]
+
+
+@pytest.mark.parametrize("path, status", [
+    ("/brackets/0", 404),
+    ("/brackets/4", 404),
+    ("/brackets/abc", 400),
+    ("/nowhere", 404),
+    ("/brackets?start=0", 400),
+    ("/brackets?count=0", 400),
+    ("/brackets?start=x", 400),
+])
+def test_error_status(path, status):
+    _, actual, _, body = get(path)
+
+    assert actual == status
+    assert "error" in json.loads(body)
+
+
+def test_stats():
+    _, status, _, body = get("/stats")
+
+    assert status == 200
+    assert json.loads(body) == {
+        "total_brackets": 3,
+        "bracket_sizes": {"3": 3},
+        "champions": {"duke": 1, "baylor": 1, "gonzaga": 1},
+    }
+
+
+def test_stats_are_not_rebuilt_after_cache_fills(monkeypatch):
+    brackets = [[f"team-{i}", "other", f"team-{i}"] for i in range(2000)]
+    app = BracketServer(brackets, cache_bytes=50 * 1024)
+    for index in range(500):
+        app.bracket_json(index)
+
+    def fail(*args):
+        raise AssertionError("stats rebuilt")
+
+    monkeypatch.setattr("src.server.app.Counter", fail)
+    _, status, _, body = get("/stats", app=app)
+
+    assert status == 200
+    assert json.loads(body)["total_brackets"] == 2000
+
+
+def test_range_is_chunked_with_next_link():
+    _, status, headers, body = get("/brackets?start=1&count=2")
+
+    assert status == 200
+    assert headers["transfer-encoding"] == "chunked"
+    data = json.loads(body)
+    assert data["count"] == 2
+    assert data["next"] == "/brackets?start=3&count=2"
+    assert [bracket["teams"] for bracket in data["brackets"]] == BRACKETS[:2]
+
+
+def test_last_page_has_no_next_link():
+    _, _, _, body = get("/brackets?start=3&count=2")
+
+    data = json.loads(body)
+    assert data["count"] == 1
+    assert "next" not in data
+
+
+def test_range_past_the_end_is_empty():
+    _, _, _, body = get("/brackets?start=10&count=2")
+
+    assert json.loads(body)["brackets"] == []
+
+
+def test_range_count_is_clamped():
+    brackets = [["a", "b", "a"]] * (MAX_PAGE_SIZE + 5)
+    _, _, _, body = get(f"/brackets?count={MAX_PAGE_SIZE + 5}", brackets=brackets)
+
+    data = json.loads(body)
+    assert data["count"] == MAX_PAGE_SIZE
+    assert data["next"] == f"/brackets?start={MAX_PAGE_SIZE + 1}&count={MAX_PAGE_SIZE}"
+
+
+def test_range_does_not_fill_cache():
+    app, _, _, _ = get("/brackets?start=1&count=3")
+
+    assert len(app.cache) == 0
+
+
+def test_http_10_range_is_close_delimited():
+    _, status, headers, body = get("/brackets?start=1&count=1", version="HTTP/1.0")
+
+    assert status == 200
+    assert "transfer-encoding" not in headers
+    assert headers["connection"] == "close"
+    assert json.loads(body)["brackets"][0]["teams"] == BRACKETS[0]
+
+
+def test_http_10_closes_by_default():
+    # request() reads until EOF, so this times out if the server keeps the connection open
+    _, response = request(b"GET /brackets/1 HTTP/1.0\r\n\r\n")
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    assert b"Connection: close" in head
+    assert json.loads(body)["teams"] == BRACKETS[0]
+
+
+def test_keep_alive_serves_several_requests():
+    _, response = request(
+        b"GET /brackets/1 HTTP/1.1\r\n\r\n"
+        b"GET /brackets?count=1 HTTP/1.1\r\n\r\n"
+        b"GET /stats HTTP/1.1\r\nConnection: close\r\n\r\n"
+    )
+
+    assert response.count(b"HTTP/1.1 200 OK") == 3
+
+
+def test_unsupported_version():
+    _, response = request(b"GET /stats HTTP/2.0\r\n\r\n")
+
+    assert response.startswith(b"HTTP/1.1 505")
+
+
+def test_oversized_request_line():
+    _, response = request(b"GET /" + b"a" * 70000 + b" HTTP/1.1\r\n\r\n")
+
+    assert response.startswith(b"HTTP/1.1 431")
+
+
+def test_method_not_allowed():
+    _, response = request(b"POST /stats HTTP/1.1\r\nConnection: close\r\n\r\n")
+
+    assert response.startswith(b"HTTP/1.1 405")
@@ -0,0 +1,106 @@
+import logging
+
+import pytest
+
+from src.data.parser import parse_input_file
+from src.data.window import BracketWindow, estimate_size
+
+
+@pytest.fixture
+def bracket_file(tmp_path):
+    path = tmp_path / "brackets"
+    path.write_text("".join(f"['team-{i}', 'other-{i}', 'team-{i}']\n" for i in range(50)))
+    return str(path)
+
+
+def test_get_matches_parse_input_file(bracket_file):
+    with BracketWindow(bracket_file) as window:
+        assert len(window) == 50
+        assert [window.get(i)[0] for i in range(len(window))] == parse_input_file(bracket_file)
+
+
+def test_layout_is_cached_with_bracket(bracket_file):
+    calls = []
+
+    def layout(teams):
+        calls.append(teams)
+        return len(teams)
+
+    with BracketWindow(bracket_file, layout=layout) as window:
+        assert window.get(3) == (['team-3', 'other-3', 'team-3'], 3)
+        window.get(3)
+
+    assert len(calls) == 1
+
+
+def test_memory_cap_bounds_cached_entries(bracket_file):
+    entry_size = estimate_size((['team-0', 'other-0', 'team-0'], None))
+
+    with BracketWindow(bracket_file, max_bytes=entry_size * 5, prefetch=0) as window:
+        for i in range(len(window)):
+            window.get(i)
+
+        assert window.cache.size <= entry_size * 5
+        assert len(window.cache) < 10
+        assert 49 in window.cache
+        assert 0 not in window.cache
+
+
+@pytest.mark.parametrize("index, direction, expected", [
+    (10, 1, {11, 12}),
+    (10, -1, {9, 8}),
+    (49, 1, {0, 1}),
+    (0, -1, {49, 48}),
+])
+def test_prefetch_loads_neighbours_in_direction_of_travel(bracket_file, index, direction, expected):
+    with BracketWindow(bracket_file, prefetch=2) as window:
+        window.prefetch(index, direction)
+        for future in window._pending:
+            future.result(timeout=5)
+
+        assert set(window.cache._entries) == expected
+
+
+def test_prefetch_cancels_previous_batch(bracket_file):
+    with BracketWindow(bracket_file, prefetch=2) as window:
+        # Hold the lock so queued prefetches can't start
+        with window._lock:
+            window.prefetch(10, 1)
+            stale = list(window._pending)
+            window.prefetch(10, -1)
+
+        assert stale[-1].cancelled()
+        for future in window._pending:
+            future.result(timeout=5)
+        assert 12 not in window.cache
+
+
+def test_prefetch_logger_does_not_fall_back_to_stderr():
+    # Without a handler of its own, logging would write records over the curses screen
+    handlers = logging.getLogger("src.data.window").handlers
+
+    assert any(isinstance(handler, logging.NullHandler) for handler in handlers)
+
+
+def test_prefetch_failure_is_raised_by_get(bracket_file):
+    def layout(teams):
+        raise RuntimeError("bad layout")
+
+    with BracketWindow(bracket_file, layout=layout, prefetch=1) as window:
+        window.prefetch(0, 1)
+        window._pending[0].exception(timeout=5)
+
+        with pytest.raises(RuntimeError, match="bad layout"):
+            window.get(1)
+
+
+def test_prefetch_failures_are_logged(bracket_file, caplog):
+    def layout(teams):
+        raise RuntimeError("bad layout")
+
+    with caplog.at_level(logging.ERROR, logger="src.data.window"):
+        with BracketWindow(bracket_file, layout=layout, prefetch=1) as window:
+            window.prefetch(0, 1)
+
+    assert "Failed to prefetch bracket" in caplog.text
+    assert "bad layout" in caplog.text